@@ -17,7 +17,6 @@ import sys
 import tempfile
 import time
 
-from collections import OrderedDict
 from urllib.parse import urlparse
 from urllib.parse import quote as urlquote
 
@@ -724,6 +723,7 @@ def get_mirror_url(mirror_url, filename, mysettings, cache_path=None):
 
 async def async_mirror_url(mirror_url, filename, mysettings, cache_path=None):
     mirror_conf = MirrorLayoutConfig()
+    parsed_mirror_url = urlparse(mirror_url)
 
     cache = {}
     if cache_path is not None:
@@ -738,7 +738,7 @@ async def async_mirror_url(mirror_url, filename, mysettings, cache_path=None):
     if ts >= time.time() - 86400:
         mirror_conf.deserialize(data)
     else:
-        tmpfile = f".layout.conf.{urlparse(mirror_url).hostname}"
+        tmpfile = f".layout.conf.{parsed_mirror_url.hostname}"
         try:
             if mirror_url[:1] == "/":
                 tmpfile = os.path.join(mirror_url, "layout.conf")
@@ -765,7 +765,7 @@ async def async_mirror_url(mirror_url, filename, mysettings, cache_path=None):
     # For some protocols, urlquote is required for correct behavior,
     # and it must not be used for other protocols like rsync and sftp.
     path = mirror_conf.get_best_supported_layout(filename=filename).get_path(filename)
-    if urlparse(mirror_url).scheme in ("ftp", "http", "https"):
+    if parsed_mirror_url.scheme in ("ftp", "http", "https"):
         path = urlquote(path)
     if mirror_url[:1] == "/":
         return os.path.join(mirror_url, path)
@@ -1052,10 +1052,16 @@ async def async_fetch(
     force_mirror = "force-mirror" in features and not restrict_mirror and try_mirrors
 
     file_uri_tuples = []
+    # Deduplicate (file, uri) pairs at ingestion, so that a URI which is
+    # repeated in SRC_URI does not trigger redundant fetch attempts.
+    seen_uri_tuples = set()
     # Check for 'items' attribute since OrderedDict is not a dict.
     if hasattr(myuris, "items"):
         for myfile, uri_set in myuris.items():
             for myuri in uri_set:
+                if (myfile, myuri) in seen_uri_tuples:
+                    continue
+                seen_uri_tuples.add((myfile, myuri))
                 file_uri_tuples.append(
                     (DistfileName(myfile, digests=mydigests.get(myfile)), myuri)
                 )
@@ -1065,30 +1071,42 @@ async def async_fetch(
                 )
     else:
         for myuri in myuris:
-            if urlparse(myuri).scheme:
-                file_uri_tuples.append(
-                    (
-                        DistfileName(
-                            os.path.basename(myuri),
-                            digests=mydigests.get(os.path.basename(myuri)),
-                        ),
-                        myuri,
-                    )
-                )
-            else:
-                file_uri_tuples.append(
-                    (
-                        DistfileName(
-                            os.path.basename(myuri),
-                            digests=mydigests.get(os.path.basename(myuri)),
-                        ),
-                        None,
-                    )
-                )
+            myfile = os.path.basename(myuri)
+            if not urlparse(myuri).scheme:
+                myuri = None
+            if (myfile, myuri) in seen_uri_tuples:
+                continue
+            seen_uri_tuples.add((myfile, myuri))
+            file_uri_tuples.append(
+                (DistfileName(myfile, digests=mydigests.get(myfile)), myuri)
+            )
 
-    filedict = OrderedDict()
+    if distdir_writable:
+        mirror_cache = os.path.join(mysettings["DISTDIR"], ".mirror-cache.json")
+    else:
+        mirror_cache = None
+
+    # Strip trailing slashes from the specific-mirror base URLs once,
+    # rather than once per SRC_URI entry in the loop below. Work on
+    # copies, since the thirdpartymirrors result is cached on the
+    # config instance.
+    custommirrors = {
+        name: [base.rstrip("/") for base in bases]
+        for name, bases in custommirrors.items()
+    }
+    thirdpartymirrors = {
+        name: [base.rstrip("/") for base in bases]
+        for name, bases in thirdpartymirrors.items()
+    }
+
+    filedict = {}
     primaryuri_dict = {}
     thirdpartymirror_uris = {}
+    # Per-file sets of mirror-expanded URIs, so that overlapping mirror
+    # definitions (the same base listed for several mirror names, or in
+    # both the custom and the official lists) do not queue the same URL
+    # more than once.
+    specific_mirror_uris_seen = {}
     for myfile, myuri in file_uri_tuples:
         override_mirror = (myuri or "").startswith("mirror+")
         override_fetch = override_mirror or (myuri or "").startswith("fetch+")
@@ -1097,10 +1115,6 @@ async def async_fetch(
 
         if myfile not in filedict:
             filedict[myfile] = []
-            if distdir_writable:
-                mirror_cache = os.path.join(mysettings["DISTDIR"], ".mirror-cache.json")
-            else:
-                mirror_cache = None
 
             # fetch restriction implies mirror restriction
             # but fetch unrestriction does not grant mirror permission
@@ -1130,17 +1144,24 @@ async def async_fetch(
                 mirrorname = myuri[9:eidx]
                 path = myuri[eidx + 1 :]
 
+                seen_uris = specific_mirror_uris_seen.setdefault(myfile, set())
+
                 # Try user-defined mirrors first
                 if mirrorname in custommirrors:
                     for cmirr in custommirrors[mirrorname]:
-                        filedict[myfile].append(cmirr.rstrip("/") + "/" + path)
+                        uri = cmirr + "/" + path
+                        if uri not in seen_uris:
+                            seen_uris.add(uri)
+                            filedict[myfile].append(uri)
 
                 # now try the official mirrors
                 if mirrorname in thirdpartymirrors:
-                    uris = [
-                        locmirr.rstrip("/") + "/" + path
-                        for locmirr in thirdpartymirrors[mirrorname]
-                    ]
+                    uris = []
+                    for locmirr in thirdpartymirrors[mirrorname]:
+                        uri = locmirr + "/" + path
+                        if uri not in seen_uris:
+                            seen_uris.add(uri)
+                            uris.append(uri)
                     random.shuffle(uris)
                     filedict[myfile].extend(uris)
                     thirdpartymirror_uris.setdefault(myfile, []).extend(uris)
@@ -1,7 +1,8 @@
 # Copyright 2022-2024 Gentoo Authors
 # Distributed under the terms of the GNU General Public License v2
 
-from unittest.mock import patch, mock_open
+from unittest.mock import patch
+import io
 import json
 
 from portage.tests import TestCase
@@ -208,23 +209,32 @@ _TWO_RESUME_LISTS_JSON = b"""{
 """
 
 
+_ALL_FIXTURES = (
+    _ONE_RESUME_LIST_JSON,
+    _EMPTY_FILE,
+    _PARTIAL_FILE_JSON,
+    _TWO_RESUME_LISTS_JSON,
+)
+
+
+def _fake_open(contents):
+    """Return a replacement for ``open`` that serves ``contents`` from
+    memory, without the overhead of a ``mock_open`` MagicMock."""
+    return lambda *args, **kwargs: io.BytesIO(contents)
+
+
 class MtimeDBTestCase(TestCase):
     text = b"Unit tests for MtimeDB"
 
     def test_instances_created_with_only_expected_keys(self):
-        all_fixtures = (
-            _ONE_RESUME_LIST_JSON,
-            _EMPTY_FILE,
-            _PARTIAL_FILE_JSON,
-            _TWO_RESUME_LISTS_JSON,
-        )
-        for contents in all_fixtures:
-            with patch("portage.util.mtimedb.open", mock_open(read_data=contents)):
-                mtimedb = MtimeDB("/path/to/mtimedb")
-            self.assertLessEqual(set(mtimedb.keys()), _MTIMEDBKEYS)
+        for index, contents in enumerate(_ALL_FIXTURES):
+            with self.subTest(fixture=index):
+                with patch("portage.util.mtimedb.open", _fake_open(contents)):
+                    mtimedb = MtimeDB("/path/to/mtimedb")
+                self.assertLessEqual(set(mtimedb.keys()), _MTIMEDBKEYS)
 
     def test_default_values(self):
-        with patch("portage.util.mtimedb.open", mock_open(read_data=_EMPTY_FILE)):
+        with patch("portage.util.mtimedb.open", _fake_open(_EMPTY_FILE)):
             mtimedb = MtimeDB("/some/path/mtimedb")
         self.assertEqual(mtimedb["starttime"], 0)
         self.assertEqual(mtimedb["version"], "")
@@ -233,17 +243,13 @@ class MtimeDBTestCase(TestCase):
         self.assertEqual(mtimedb["updates"], {})
 
     def test_instances_keep_a_deepcopy_of_clean_data(self):
-        with patch(
-            "portage.util.mtimedb.open", mock_open(read_data=_ONE_RESUME_LIST_JSON)
-        ):
+        with patch("portage.util.mtimedb.open", _fake_open(_ONE_RESUME_LIST_JSON)):
             mtimedb = MtimeDB("/some/path/mtimedb")
         self.assertEqual(dict(mtimedb), dict(mtimedb._clean_data))
         self.assertIsNot(mtimedb, mtimedb._clean_data)
 
     def test_load_data_called_at_instance_creation_time(self):
-        with patch(
-            "portage.util.mtimedb.open", mock_open(read_data=_ONE_RESUME_LIST_JSON)
-        ):
+        with patch("portage.util.mtimedb.open", _fake_open(_ONE_RESUME_LIST_JSON)):
             mtimedb = MtimeDB("/some/path/mtimedb")
         self.assertEqual(
             mtimedb["info"],
@@ -311,7 +317,7 @@ class MtimeDBTestCase(TestCase):
 
     @patch("portage.util.mtimedb.MtimeDB._MtimeDB__write_to_disk")
     def test_commit_writes_to_disk_if_needed_and_possible(self, pwrite2disk):
-        with patch("portage.util.mtimedb.open", mock_open(read_data=_EMPTY_FILE)):
+        with patch("portage.util.mtimedb.open", _fake_open(_EMPTY_FILE)):
             mtimedb = MtimeDB("/some/path/mtimedb")
         mtimedb.commit()
         pwrite2disk.assert_not_called()
@@ -323,7 +329,7 @@ class MtimeDBTestCase(TestCase):
 
     @patch("portage.util.mtimedb.MtimeDB._MtimeDB__write_to_disk")
     def test_commit_does_not_write_to_disk_if_no_file(self, pwrite2disk):
-        with patch("portage.util.mtimedb.open", mock_open(read_data=_EMPTY_FILE)):
+        with patch("portage.util.mtimedb.open", _fake_open(_EMPTY_FILE)):
             mtimedb = MtimeDB("/some/path/mtimedb")
         mtimedb["updates"]["/long/path/1Q-2021"] = 1739992409
         mtimedb.filename = None
@@ -332,15 +338,13 @@ class MtimeDBTestCase(TestCase):
 
     @patch("portage.util.mtimedb.MtimeDB._MtimeDB__write_to_disk")
     def test_commit_does_not_write_to_disk_if_no_changes(self, pwrite2disk):
-        with patch("portage.util.mtimedb.open", mock_open(read_data=_EMPTY_FILE)):
+        with patch("portage.util.mtimedb.open", _fake_open(_EMPTY_FILE)):
             mtimedb = MtimeDB("/some/path/mtimedb")
         mtimedb.commit()
         pwrite2disk.assert_not_called()
 
     def test_is_readonly_attribute(self):
-        with patch(
-            "portage.util.mtimedb.open", mock_open(read_data=_ONE_RESUME_LIST_JSON)
-        ):
+        with patch("portage.util.mtimedb.open", _fake_open(_ONE_RESUME_LIST_JSON)):
             mtimedb = MtimeDB("/some/path/mtimedb")
         self.assertFalse(mtimedb.is_readonly)
 
@@ -351,9 +355,7 @@ class MtimeDBTestCase(TestCase):
         self.assertFalse(mtimedb.is_readonly)
 
     def test_make_readonly(self):
-        with patch(
-            "portage.util.mtimedb.open", mock_open(read_data=_ONE_RESUME_LIST_JSON)
-        ):
+        with patch("portage.util.mtimedb.open", _fake_open(_ONE_RESUME_LIST_JSON)):
             mtimedb = MtimeDB("/some/path/mtimedb")
         mtimedb.make_readonly()
         self.assertTrue(mtimedb.is_readonly)
@@ -362,9 +364,7 @@ class MtimeDBTestCase(TestCase):
     @patch("portage.util.mtimedb.apply_secpass_permissions")
     @patch("portage.util.mtimedb.atomic_ofstream")
     def test_write_to_disk(self, matomic_ofstream, mapply_perms):
-        with patch(
-            "portage.util.mtimedb.open", mock_open(read_data=_ONE_RESUME_LIST_JSON)
-        ):
+        with patch("portage.util.mtimedb.open", _fake_open(_ONE_RESUME_LIST_JSON)):
             mtimedb = MtimeDB("/some/path/mtimedb")
         d = {"z": "zome", "a": "AAA"}
         encoding = portage._encodings["repo.content"]
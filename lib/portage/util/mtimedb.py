@@ -16,22 +16,23 @@ import json
 
 import portage
 from portage import _encodings
-from portage import _unicode_decode
 from portage import _unicode_encode
 from portage.data import portage_gid, uid
 from portage.localization import _
 from portage.util import apply_secpass_permissions, atomic_ofstream, writemsg
 
 
-_MTIMEDBKEYS = {
-    "info",
-    "ldpath",
-    "resume",
-    "resume_backup",
-    "starttime",
-    "updates",
-    "version",
-}
+_MTIMEDBKEYS = frozenset(
+    (
+        "info",
+        "ldpath",
+        "resume",
+        "resume_backup",
+        "starttime",
+        "updates",
+        "version",
+    )
+)
 
 
 class MtimeDB(dict):
@@ -79,11 +80,10 @@ class MtimeDB(dict):
         d = {}
         if content:
             try:
-                d = json.loads(
-                    _unicode_decode(
-                        content, encoding=_encodings["repo.content"], errors="strict"
-                    )
-                )
+                # json.loads accepts bytes directly and performs its own
+                # strict UTF-8 decoding, so feed it the raw content and
+                # skip a separate decode pass over the whole file.
+                d = json.loads(content)
             except SystemExit:
                 raise
             except Exception as e:
@@ -111,7 +111,7 @@ class MtimeDB(dict):
         for k in ("info", "ldpath", "updates"):
             d.setdefault(k, {})
 
-        for k in set(d.keys()) - _MTIMEDBKEYS:
+        for k in d.keys() - _MTIMEDBKEYS:
             writemsg(_(f"Deleting invalid mtimedb key: {k}\n"))
             del d[k]
         self.update(d)